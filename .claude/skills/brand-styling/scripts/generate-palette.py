@@ -18,10 +18,10 @@ Features:
 """
 
 import argparse
-import colorsys
+import functools
 import json
 import sys
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, Iterator, List
 
 
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
@@ -36,17 +36,77 @@ def rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
 
 
 def rgb_to_hsl(rgb: Tuple[int, int, int]) -> Tuple[float, float, float]:
-    """Convert RGB to HSL."""
-    r, g, b = [x / 255.0 for x in rgb]
-    h, l, s = colorsys.rgb_to_hls(r, g, b)
+    """Convert RGB to HSL (same math as colorsys.rgb_to_hls, inlined)."""
+    r, g, b = rgb[0] / 255.0, rgb[1] / 255.0, rgb[2] / 255.0
+    maxc = max(r, g, b)
+    minc = min(r, g, b)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0
+    if minc == maxc:
+        return (0.0, 0.0, l * 100)
+
+    if l <= 0.5:
+        s = rangec / sumc
+    else:
+        s = rangec / (2.0 - maxc - minc)
+
+    rc = (maxc - r) / rangec
+    gc = (maxc - g) / rangec
+    bc = (maxc - b) / rangec
+    if r == maxc:
+        h = bc - gc
+    elif g == maxc:
+        h = 2.0 + rc - bc
+    else:
+        h = 4.0 + gc - rc
+    h = (h / 6.0) % 1.0
+
     return (h * 360, s * 100, l * 100)
 
 
+ONE_THIRD = 1.0 / 3.0
+ONE_SIXTH = 1.0 / 6.0
+TWO_THIRDS = 2.0 / 3.0
+
+
+def _hue_to_channel(m1: float, m2: float, hue: float) -> float:
+    """Single RGB channel of the HLS -> RGB conversion."""
+    hue = hue % 1.0
+    if hue < ONE_SIXTH:
+        return m1 + (m2 - m1) * hue * 6.0
+    if hue < 0.5:
+        return m2
+    if hue < TWO_THIRDS:
+        return m1 + (m2 - m1) * (TWO_THIRDS - hue) * 6.0
+    return m1
+
+
+def hsl_to_hex(h: float, s: float, l: float) -> str:
+    """
+    Convert HSL (degrees, %, %) straight to a hex color.
+    Same math as colorsys.hls_to_rgb, without the intermediate tuples.
+    """
+    h, s, l = h / 360, s / 100, l / 100
+    if s == 0.0:
+        v = int(l * 255)
+        return f'#{v:02x}{v:02x}{v:02x}'
+
+    if l <= 0.5:
+        m2 = l * (1.0 + s)
+    else:
+        m2 = l + s - (l * s)
+    m1 = 2.0 * l - m2
+
+    r = int(_hue_to_channel(m1, m2, h + ONE_THIRD) * 255)
+    g = int(_hue_to_channel(m1, m2, h) * 255)
+    b = int(_hue_to_channel(m1, m2, h - ONE_THIRD) * 255)
+    return f'#{r:02x}{g:02x}{b:02x}'
+
+
 def hsl_to_rgb(hsl: Tuple[float, float, float]) -> Tuple[int, int, int]:
     """Convert HSL to RGB."""
-    h, s, l = hsl[0] / 360, hsl[1] / 100, hsl[2] / 100
-    r, g, b = colorsys.hls_to_rgb(h, l, s)
-    return (int(r * 255), int(g * 255), int(b * 255))
+    return hex_to_rgb(hsl_to_hex(*hsl))
 
 
 def adjust_lightness(hex_color: str, amount: float) -> str:
@@ -54,52 +114,58 @@ def adjust_lightness(hex_color: str, amount: float) -> str:
     Adjust the lightness of a color.
     Amount: positive to lighten, negative to darken.
     """
-    rgb = hex_to_rgb(hex_color)
-    h, s, l = rgb_to_hsl(rgb)
-    l = max(0, min(100, l + amount))
-    new_rgb = hsl_to_rgb((h, s, l))
-    return rgb_to_hex(new_rgb)
+    h, s, l = rgb_to_hsl(hex_to_rgb(hex_color))
+    return hsl_to_hex(h, s, max(0, min(100, l + amount)))
 
 
-def generate_shades(hex_color: str, steps: int = 9) -> Dict[str, str]:
-    """Generate color shades from 50 (lightest) to 900 (darkest)."""
-    shades = {}
-    scale = [50, 100, 200, 300, 400, 500, 600, 700, 800, 900]
+# Lightness offsets (in % points) applied to the base color for each shade.
+# Shade 500 is the base color itself.
+SHADE_LIGHTNESS_OFFSETS = (
+    (50, 60), (100, 48), (200, 36), (300, 24), (400, 12),
+    (600, -16), (700, -24), (800, -32), (900, -40),
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _shade_items(hex_color: str) -> Tuple[Tuple[int, str], ...]:
+    """Compute (shade, color) pairs once per base color."""
+    # Convert the base color to HSL once and derive every shade from it
+    h, s, l = rgb_to_hsl(hex_to_rgb(hex_color))
 
     # Middle shade (500) is the base color
-    shades[500] = hex_color
+    items = [(500, hex_color)]
+    for shade, offset in SHADE_LIGHTNESS_OFFSETS:
+        items.append((shade, hsl_to_hex(h, s, max(0, min(100, l + offset)))))
+
+    return tuple(items)
+
 
-    # Generate lighter shades (50-400)
-    for i, shade in enumerate(scale[:5]):
-        if shade == 500:
-            continue
-        lightness_adjustment = (5 - i) * 12  # Adjust by 12% for each step
-        shades[shade] = adjust_lightness(hex_color, lightness_adjustment)
+def generate_shades(hex_color: str, steps: int = 9) -> Dict[str, str]:
+    """Generate color shades from 50 (lightest) to 900 (darkest)."""
+    return dict(_shade_items(hex_color))
 
-    # Generate darker shades (600-900)
-    for i, shade in enumerate(scale[5:]):
-        if shade == 500:
-            continue
-        lightness_adjustment = -(i + 1) * 8  # Adjust by -8% for each step
-        shades[shade] = adjust_lightness(hex_color, lightness_adjustment)
 
-    return shades
+def _srgb_to_linear(val: int) -> float:
+    """Linearize one 8-bit sRGB channel value."""
+    val = val / 255.0
+    return val / 12.92 if val <= 0.03928 else ((val + 0.055) / 1.055) ** 2.4
 
 
-def get_relative_luminance(rgb: Tuple[int, int, int]) -> float:
-    """Calculate relative luminance for contrast ratio."""
-    def adjust(val):
-        val = val / 255.0
-        return val / 12.92 if val <= 0.03928 else ((val + 0.055) / 1.055) ** 2.4
+# Channels only take 256 values, so linearize each one once up front
+SRGB_TO_LINEAR = tuple(_srgb_to_linear(val) for val in range(256))
 
-    r, g, b = [adjust(x) for x in rgb]
-    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+@functools.lru_cache(maxsize=512)
+def get_relative_luminance(hex_color: str) -> float:
+    """Calculate relative luminance for contrast ratio (cached per color)."""
+    r, g, b = bytes.fromhex(hex_color.lstrip('#'))
+    return 0.2126 * SRGB_TO_LINEAR[r] + 0.7152 * SRGB_TO_LINEAR[g] + 0.0722 * SRGB_TO_LINEAR[b]
 
 
 def contrast_ratio(color1: str, color2: str) -> float:
     """Calculate WCAG contrast ratio between two colors."""
-    lum1 = get_relative_luminance(hex_to_rgb(color1))
-    lum2 = get_relative_luminance(hex_to_rgb(color2))
+    lum1 = get_relative_luminance(color1)
+    lum2 = get_relative_luminance(color2)
 
     lighter = max(lum1, lum2)
     darker = min(lum1, lum2)
@@ -107,6 +173,22 @@ def contrast_ratio(color1: str, color2: str) -> float:
     return (lighter + 0.05) / (darker + 0.05)
 
 
+def contrast_matrix(foregrounds: List[str], backgrounds: List[str]) -> List[List[float]]:
+    """
+    Calculate WCAG contrast ratios for every foreground/background pair.
+    Each color's luminance is computed once, then reused across the whole row/column.
+    """
+    # Flat per-side arrays of (luminance + 0.05), so each pair costs one
+    # comparison and one division
+    fg_offsets = [get_relative_luminance(fg) + 0.05 for fg in foregrounds]
+    bg_offsets = [get_relative_luminance(bg) + 0.05 for bg in backgrounds]
+
+    return [
+        [fg / bg if fg >= bg else bg / fg for bg in bg_offsets]
+        for fg in fg_offsets
+    ]
+
+
 def check_wcag_compliance(ratio: float) -> Dict[str, Dict[str, bool]]:
     """Check WCAG AA and AAA compliance."""
     return {
@@ -121,71 +203,81 @@ def check_wcag_compliance(ratio: float) -> Dict[str, Dict[str, bool]]:
     }
 
 
-def generate_opacity_variants(hex_color: str) -> Dict[str, str]:
-    """Generate opacity variants of a color."""
-    rgb = hex_to_rgb(hex_color)
-    opacities = {
-        10: 0.1,
-        20: 0.2,
-        30: 0.3,
-        40: 0.4,
-        50: 0.5,
-        60: 0.6,
-        70: 0.7,
-        80: 0.8,
-        90: 0.9,
-    }
-
-    return {
-        f'{percent}': f'rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, {opacity})'
-        for percent, opacity in opacities.items()
-    }
+OPACITY_LEVELS = (10, 20, 30, 40, 50, 60, 70, 80, 90)
 
 
-def output_javascript(color_name: str, base_color: str) -> str:
-    """Generate JavaScript color configuration."""
-    shades = generate_shades(base_color)
-    opacities = generate_opacity_variants(base_color)
+@functools.lru_cache(maxsize=32)
+def _opacity_items(hex_color: str) -> Tuple[Tuple[str, str], ...]:
+    """Compute (percent, rgba) pairs once per base color."""
+    r, g, b = hex_to_rgb(hex_color)
+    prefix = f'rgba({r}, {g}, {b}, '
 
-    js_code = f"""// {color_name.title()} Color Palette
-export const {color_name}Colors = {{
-  DEFAULT: '{base_color}',
+    return tuple(
+        (f'{percent}', f'{prefix}{percent / 100})')
+        for percent in OPACITY_LEVELS
+    )
 
-  // Shades
-"""
 
-    for shade, color in sorted(shades.items()):
-        js_code += f"  {shade}: '{color}',\n"
+def generate_opacity_variants(hex_color: str) -> Dict[str, str]:
+    """Generate opacity variants of a color."""
+    return dict(_opacity_items(hex_color))
+
+
+# Output templates are built once from the fixed shade/opacity scales, so each
+# output_* call is a single format_map() instead of per-line formatting.
+SHADE_SCALE = (50, 100, 200, 300, 400, 500, 600, 700, 800, 900)
+
+JS_TEMPLATE = (
+    "// {title} Color Palette\n"
+    "export const {name}Colors = {{\n"
+    "  DEFAULT: '{base}',\n"
+    "\n"
+    "  // Shades\n"
+    + "".join(f"  {shade}: '{{s{shade}}}',\n" for shade in SHADE_SCALE)
+    + "\n  // Opacity Variants\n  opacity: {{\n"
+    + "".join(f"    {percent}: '{{op{percent}}}',\n" for percent in OPACITY_LEVELS)
+    + "  }},\n}};\n"
+)
+
+CSS_TEMPLATE = (
+    "/* {title} Color Palette */\n"
+    ":root {{\n"
+    "  --{name}: {base};\n"
+    "\n"
+    "  /* Shades */\n"
+    + "".join(f"  --{{name}}-{shade}: {{s{shade}}};\n" for shade in SHADE_SCALE)
+    + "\n  /* Opacity Variants */\n"
+    + "".join(f"  --{{name}}-opacity-{percent}: {{op{percent}}};\n" for percent in OPACITY_LEVELS)
+    + "}}\n"
+)
+
+TAILWIND_TEMPLATE = (
+    "// Add to tailwind.config.js theme.extend.colors\n"
+    "{name}: {{\n"
+    "  DEFAULT: '{base}',\n"
+    + "".join(f"  {shade}: '{{s{shade}}}',\n" for shade in SHADE_SCALE)
+    + "}},\n"
+)
+
+
+def template_values(color_name: str, base_color: str) -> Dict[str, str]:
+    """Build the placeholder values shared by the output templates."""
+    values = {'name': color_name, 'title': color_name.title(), 'base': base_color}
+    for shade, color in generate_shades(base_color).items():
+        values[f's{shade}'] = color
+    for percent, rgba in generate_opacity_variants(base_color).items():
+        values[f'op{percent}'] = rgba
+    return values
 
-    js_code += "\n  // Opacity Variants\n  opacity: {\n"
-    for percent, rgba in opacities.items():
-        js_code += f"    {percent}: '{rgba}',\n"
-    js_code += "  },\n};\n"
 
-    return js_code
+def output_javascript(color_name: str, base_color: str) -> str:
+    """Generate JavaScript color configuration."""
+    return JS_TEMPLATE.format_map(template_values(color_name, base_color))
 
 
 def output_css(color_name: str, base_color: str) -> str:
     """Generate CSS custom properties."""
-    shades = generate_shades(base_color)
-    opacities = generate_opacity_variants(base_color)
-
-    css_code = f"""/* {color_name.title()} Color Palette */
-:root {{
-  --{color_name}: {base_color};
-
-  /* Shades */
-"""
-
-    for shade, color in sorted(shades.items()):
-        css_code += f"  --{color_name}-{shade}: {color};\n"
-
-    css_code += "\n  /* Opacity Variants */\n"
-    for percent, rgba in opacities.items():
-        css_code += f"  --{color_name}-opacity-{percent}: {rgba};\n"
-    css_code += "}\n"
-
-    return css_code
+    return CSS_TEMPLATE.format_map(template_values(color_name, base_color))
 
 
 def output_json(color_name: str, base_color: str) -> str:
@@ -206,39 +298,60 @@ def output_json(color_name: str, base_color: str) -> str:
 
 def output_tailwind(color_name: str, base_color: str) -> str:
     """Generate Tailwind config color object."""
-    shades = generate_shades(base_color)
+    return TAILWIND_TEMPLATE.format_map(template_values(color_name, base_color))
 
-    tw_code = f"""// Add to tailwind.config.js theme.extend.colors
-{color_name}: {{
-  DEFAULT: '{base_color}',
-"""
 
-    for shade, color in sorted(shades.items()):
-        tw_code += f"  {shade}: '{color}',\n"
+def iter_contrast_tests(base_color: str, backgrounds: List[str]) -> Iterator[str]:
+    """Yield the contrast test report section by section."""
+    yield f"\nContrast Ratio Tests for {base_color}\n"
+    yield "=" * 60 + "\n\n"
 
-    tw_code += "},\n"
+    ratios = contrast_matrix([base_color], backgrounds)[0]
+    for bg, ratio in zip(backgrounds, ratios):
+        compliance = check_wcag_compliance(ratio)
 
-    return tw_code
+        yield (
+            f"Against {bg}:\n"
+            f"  Contrast Ratio: {ratio:.2f}:1\n"
+            f"  WCAG AA Normal Text: {'✓' if compliance['AA']['normal_text'] else '✗'}\n"
+            f"  WCAG AA Large Text: {'✓' if compliance['AA']['large_text'] else '✗'}\n"
+            f"  WCAG AAA Normal Text: {'✓' if compliance['AAA']['normal_text'] else '✗'}\n"
+            f"  WCAG AAA Large Text: {'✓' if compliance['AAA']['large_text'] else '✗'}\n"
+            "\n"
+        )
 
 
 def test_contrast_ratios(base_color: str, backgrounds: List[str]) -> str:
     """Test contrast ratios against multiple backgrounds."""
-    output = f"\nContrast Ratio Tests for {base_color}\n"
-    output += "=" * 60 + "\n\n"
+    return "".join(iter_contrast_tests(base_color, backgrounds))
 
-    for bg in backgrounds:
-        ratio = contrast_ratio(base_color, bg)
-        compliance = check_wcag_compliance(ratio)
 
-        output += f"Against {bg}:\n"
-        output += f"  Contrast Ratio: {ratio:.2f}:1\n"
-        output += f"  WCAG AA Normal Text: {'✓' if compliance['AA']['normal_text'] else '✗'}\n"
-        output += f"  WCAG AA Large Text: {'✓' if compliance['AA']['large_text'] else '✗'}\n"
-        output += f"  WCAG AAA Normal Text: {'✓' if compliance['AAA']['normal_text'] else '✗'}\n"
-        output += f"  WCAG AAA Large Text: {'✓' if compliance['AAA']['large_text'] else '✗'}\n"
-        output += "\n"
+OUTPUT_FUNCTIONS = {
+    'js': output_javascript,
+    'css': output_css,
+    'json': output_json,
+    'tailwind': output_tailwind,
+}
 
-    return output
+
+def iter_report(color_name: str, base_color: str, fmt: str, backgrounds: List[str]) -> Iterator[str]:
+    """
+    Yield the full report chunk by chunk, so it can be written out
+    without first building the whole thing in memory.
+    """
+    if fmt == 'all':
+        for name, output_function in OUTPUT_FUNCTIONS.items():
+            yield f"\n{'='*60}\n"
+            yield f"{name.upper()} Format\n"
+            yield f"{'='*60}\n\n"
+            yield output_function(color_name, base_color)
+            yield "\n"
+    else:
+        yield OUTPUT_FUNCTIONS[fmt](color_name, base_color)
+
+    # Add contrast tests for all formats
+    yield "\n"
+    yield from iter_contrast_tests(base_color, backgrounds)
 
 
 def main():
@@ -303,38 +416,21 @@ def main():
     if not base_color.startswith('#'):
         base_color = '#' + base_color
 
-    # Generate output based on format
-    output_functions = {
-        'js': output_javascript,
-        'css': output_css,
-        'json': output_json,
-        'tailwind': output_tailwind,
-    }
-
-    if args.format == 'all':
-        result = ""
-        for fmt in ['js', 'css', 'json', 'tailwind']:
-            result += f"\n{'='*60}\n"
-            result += f"{fmt.upper()} Format\n"
-            result += f"{'='*60}\n\n"
-            result += output_functions[fmt](args.name, base_color)
-            result += "\n"
-
-        # Add contrast tests
-        result += "\n" + test_contrast_ratios(base_color, args.test_backgrounds)
-    else:
-        result = output_functions[args.format](args.name, base_color)
+    # The report is generated lazily, so parse every input color up front:
+    # bad input must fail before --output truncates an existing file
+    for color in [base_color, *args.test_backgrounds]:
+        get_relative_luminance(color)
 
-        # Add contrast tests for all formats
-        result += "\n" + test_contrast_ratios(base_color, args.test_backgrounds)
+    report = iter_report(args.name, base_color, args.format, args.test_backgrounds)
 
     # Output to file or stdout
     if args.output:
         with open(args.output, 'w') as f:
-            f.write(result)
+            f.writelines(report)
         print(f"Color palette written to {args.output}")
     else:
-        print(result)
+        sys.stdout.writelines(report)
+        print()
 
 
 if __name__ == '__main__':
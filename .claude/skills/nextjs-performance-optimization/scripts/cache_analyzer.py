@@ -13,11 +13,186 @@ Examples:
     python cache_analyzer.py src/app
 """
 
+import bisect
+import mmap
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from collections import defaultdict
+from typing import NamedTuple
+
+
+# Patterns are compiled once at import time and shared across every file scanned.
+# They are bytes patterns: files are scanned as raw bytes, never decoded.
+#
+# FETCH_SITE_RE finds fetch( calls that take at least one argument, skipping
+# identifiers that merely end in "fetch" (refetch, obj.fetch, $fetch).
+# FETCH_RE matches a whole call from such a site and captures the arguments
+# after the first top-level comma (the options) in group 1, allowing one
+# level of nested parentheses. Its character classes are disjoint from the
+# parentheses/comma that end each loop, so it never backtracks ambiguously
+# and stays linear on minified or unterminated calls.
+# The boundary lookbehind follows the literal so re keeps its fast prefix scan
+FETCH_SITE_RE = re.compile(rb'fetch(?<![\w.$]fetch)\s*\((?!\s*\))')
+FETCH_RE = re.compile(
+    FETCH_SITE_RE.pattern +
+    rb'[^(),]*(?:\([^()]*\)[^(),]*)*'
+    rb'(?:,([^()]*(?:\([^()]*\)[^()]*)*))?'
+    rb'\)'
+)
+# Sites FETCH_RE cannot match (deeper nesting) are resolved by balancing
+# parentheses over the whole file; an unterminated call's options are cut
+# off after this many bytes
+CALL_TOKEN_RE = re.compile(rb'[(),]')
+MAX_CALL_LENGTH = 8 * 1024
+ASYNC_COMPONENT_RE = re.compile(rb'async\s+function\s+\w+\s*\([^)]*\)\s*{')
+EXPENSIVE_OPS_RE = re.compile(rb'fetch\(|await |db\.|prisma\.|supabase\.')
+DYNAMIC_DATA_RE = re.compile(rb'\$\{|params\.|searchParams\.')
+MUTATION_RE = re.compile(rb'\.(?:create|update|delete|insert)\(|INSERT |UPDATE |DELETE ')
+REVALIDATE_RE = re.compile(rb'revalidate(?:Path|Tag)')
+NEWLINE_RE = re.compile(rb'\n')
+
+# Directories never worth scanning for application source
+SKIP_DIRS = {'node_modules', '.next', 'dist', '.git'}
+
+# Files at least this large are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 256 * 1024
+
+
+class Finding(NamedTuple):
+    """A single analyzer finding. Lighter than a dict per record."""
+    file: str
+    line: int
+    severity: str = ''
+    message: str = ''
+    suggestion: str = ''
+
+
+def newline_offsets(content):
+    """Return the sorted offsets of every newline in content."""
+    return [match.start() for match in NEWLINE_RE.finditer(content)]
+
+
+class LineIndex:
+    """
+    Maps offsets in a file's content to 1-based line numbers. Most files
+    produce no finding that needs one, so the newline offsets are only
+    collected on the first lookup.
+    """
+
+    def __init__(self, content):
+        self.content = content
+        self.newlines = None
+
+    def line_number(self, offset):
+        """Map a character offset to its 1-based line number."""
+        if self.newlines is None:
+            self.newlines = newline_offsets(self.content)
+        return bisect.bisect_left(self.newlines, offset) + 1
+
+
+def call_spans(content):
+    """
+    Map the offset of every '(' in content to (comma, close): the end of its
+    first top-level comma and the offset of its matching ')', each None if
+    absent. One pass over the file however many calls need it.
+    """
+    spans = {}
+    stack = []
+    for token in CALL_TOKEN_RE.finditer(content):
+        char = token.group()
+        if char == b'(':
+            stack.append([token.start(), None])
+        elif char == b')':
+            if stack:
+                start, comma = stack.pop()
+                spans[start] = (comma, token.start())
+        elif stack and stack[-1][1] is None:
+            stack[-1][1] = token.end()
+    for start, comma in stack:
+        spans[start] = (comma, None)
+    return spans
+
+
+def find_fetches(content):
+    """
+    Return (offset, options) for every fetch call in content. Calls too
+    nested for FETCH_RE are still reported, with their options found from
+    call_spans().
+    """
+    fetches = []
+    spans = None
+    for site in FETCH_SITE_RE.finditer(content):
+        match = FETCH_RE.match(content, site.start())
+        if match:
+            options = match.group(1) or b''
+        else:
+            if spans is None:
+                spans = call_spans(content)
+            comma, close = spans[site.end() - 1]
+            if comma is None:
+                options = b''
+            else:
+                options = content[comma:close if close is not None else comma + MAX_CALL_LENGTH]
+        fetches.append((site.start(), options))
+    return fetches
+
+
+def scan_content(content):
+    """
+    Collect everything the analyses need from a file in one place.
+    Returns (markers, fetches, async_component): the set of marker names
+    present, (offset, options) for every fetch call and the first async
+    component match.
+    Dependent markers are only searched for when their prerequisite is
+    present (e.g. mutations only in 'use server' files).
+    """
+    markers = set()
+    fetches = find_fetches(content)
+    async_component = ASYNC_COMPONENT_RE.search(content)
+
+    if async_component and EXPENSIVE_OPS_RE.search(content):
+        markers.add('expensive')
+
+    # Plain substring searches: a leading quote character class would keep re
+    # from using its literal-prefix fast scan. find() rather than `in`, which
+    # an mmap does not support for subsequences
+    if content.find(b"'use cache'") != -1 or content.find(b'"use cache"') != -1:
+        markers.add('use_cache')
+        if content.find(b'cacheLife(') != -1:
+            markers.add('cache_life')
+        if content.find(b'cacheTag(') != -1:
+            markers.add('cache_tag')
+        if DYNAMIC_DATA_RE.search(content):
+            markers.add('dynamic')
+
+    if content.find(b"'use server'") != -1 or content.find(b'"use server"') != -1:
+        markers.add('use_server')
+        if MUTATION_RE.search(content):
+            markers.add('mutation')
+            if REVALIDATE_RE.search(content):
+                markers.add('revalidate')
+
+    return markers, fetches, async_component
+
+
+def worker_count():
+    """Number of CPUs this process may run on."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def analyze_path(file_path):
+    """
+    Analyze a single file with a fresh analyzer.
+    Shares no state with the caller, so it can run in a worker process.
+    """
+    analyzer = CacheAnalyzer(file_path)
+    analyzer.analyze_file(file_path)
+    return analyzer.file_count, analyzer.findings, analyzer.errors
 
 
 class CacheAnalyzer:
@@ -31,167 +206,175 @@ class CacheAnalyzer:
             'warnings': []
         }
         self.file_count = 0
+        self.errors = []
 
-    def analyze_fetch_caching(self, file_path, content):
+    def analyze_fetch_caching(self, file_path, fetches, lines):
         """Analyze fetch caching patterns."""
-        # Find all fetch calls
-        fetch_pattern = r'fetch\s*\([^)]+(?:,\s*({[^}]+}))?\)'
-
-        for match in re.finditer(fetch_pattern, content):
-            line_num = content[:match.start()].count('\n') + 1
-            fetch_call = match.group()
-            options = match.group(1) if match.group(1) else ''
+        for offset, options in fetches:
+            line_num = lines.line_number(offset)
 
             # Check if fetch has cache configuration
-            has_cache = 'cache:' in options or 'next:' in options
+            has_cache = b'cache:' in options or b'next:' in options
 
             if not has_cache:
-                self.findings['uncached_fetches'].append({
-                    'file': str(file_path),
-                    'line': line_num,
-                    'severity': 'medium',
-                    'suggestion': 'Add cache configuration: { next: { revalidate: <seconds> } } or { cache: "force-cache" }'
-                })
+                self.findings['uncached_fetches'].append(Finding(
+                    file=str(file_path),
+                    line=line_num,
+                    severity='medium',
+                    suggestion='Add cache configuration: { next: { revalidate: <seconds> } } or { cache: "force-cache" }'
+                ))
             else:
                 # Check if using tags for granular invalidation
-                has_tags = 'tags:' in options
-                if not has_tags and 'next:' in options:
-                    self.findings['missing_cache_tags'].append({
-                        'file': str(file_path),
-                        'line': line_num,
-                        'severity': 'low',
-                        'suggestion': 'Consider adding cache tags for granular invalidation: tags: ["resource-name"]'
-                    })
+                has_tags = b'tags:' in options
+                if not has_tags and b'next:' in options:
+                    self.findings['missing_cache_tags'].append(Finding(
+                        file=str(file_path),
+                        line=line_num,
+                        severity='low',
+                        suggestion='Consider adding cache tags for granular invalidation: tags: ["resource-name"]'
+                    ))
                 else:
-                    self.findings['optimal_patterns'].append({
-                        'file': str(file_path),
-                        'line': line_num,
-                        'pattern': 'Fetch with cache configuration'
-                    })
+                    self.findings['optimal_patterns'].append(Finding(
+                        file=str(file_path),
+                        line=line_num,
+                        message='Fetch with cache configuration'
+                    ))
 
-    def analyze_cache_components(self, file_path, content):
+    def analyze_cache_components(self, file_path, markers, is_async_component, lines):
         """Analyze Cache Component usage (Next.js 16+)."""
         # Check for async components that could use 'use cache'
-        is_async_component = re.search(r'async\s+function\s+\w+\s*\([^)]*\)\s*{', content)
-
         if is_async_component:
-            has_use_cache = "'use cache'" in content or '"use cache"' in content
+            has_use_cache = 'use_cache' in markers
 
             # Check if component has expensive operations
-            has_expensive_ops = any(pattern in content for pattern in [
-                'fetch(',
-                'await ',
-                'db.',
-                'prisma.',
-                'supabase.'
-            ])
+            has_expensive_ops = 'expensive' in markers
 
             if has_expensive_ops and not has_use_cache:
-                line_num = content[:is_async_component.start()].count('\n') + 1
-                self.findings['missing_cache_components'].append({
-                    'file': str(file_path),
-                    'line': line_num,
-                    'severity': 'high',
-                    'suggestion': "Add 'use cache' directive at function top for component-level caching"
-                })
-
-    def analyze_cache_life(self, file_path, content):
+                line_num = lines.line_number(is_async_component.start())
+                self.findings['missing_cache_components'].append(Finding(
+                    file=str(file_path),
+                    line=line_num,
+                    severity='high',
+                    suggestion="Add 'use cache' directive at function top for component-level caching"
+                ))
+
+    def analyze_cache_life(self, file_path, markers):
         """Analyze cacheLife usage."""
-        has_use_cache = "'use cache'" in content or '"use cache"' in content
+        has_use_cache = 'use_cache' in markers
 
         if has_use_cache:
-            has_cache_life = 'cacheLife(' in content
+            has_cache_life = 'cache_life' in markers
 
             if not has_cache_life:
-                self.findings['warnings'].append({
-                    'file': str(file_path),
-                    'line': 1,
-                    'severity': 'low',
-                    'message': 'Consider using cacheLife() to specify cache duration',
-                    'suggestion': "Add: cacheLife('hours') or custom profile"
-                })
-
-    def analyze_cache_tags(self, file_path, content):
+                self.findings['warnings'].append(Finding(
+                    file=str(file_path),
+                    line=1,
+                    severity='low',
+                    message='Consider using cacheLife() to specify cache duration',
+                    suggestion="Add: cacheLife('hours') or custom profile"
+                ))
+
+    def analyze_cache_tags(self, file_path, markers):
         """Analyze cache tag usage."""
-        has_use_cache = "'use cache'" in content or '"use cache"' in content
+        has_use_cache = 'use_cache' in markers
 
         if has_use_cache:
-            has_cache_tag = 'cacheTag(' in content
+            has_cache_tag = 'cache_tag' in markers
 
             # If component fetches dynamic data, it should have tags
-            has_dynamic_data = any(pattern in content for pattern in [
-                r'\${',  # Template literals for dynamic URLs
-                'params.',
-                'searchParams.'
-            ])
+            # (template literals for dynamic URLs, route params)
+            has_dynamic_data = 'dynamic' in markers
 
             if has_dynamic_data and not has_cache_tag:
-                self.findings['warnings'].append({
-                    'file': str(file_path),
-                    'line': 1,
-                    'severity': 'medium',
-                    'message': 'Dynamic data without cache tags',
-                    'suggestion': 'Add cacheTag() for granular cache invalidation'
-                })
-
-    def analyze_revalidation(self, file_path, content):
+                self.findings['warnings'].append(Finding(
+                    file=str(file_path),
+                    line=1,
+                    severity='medium',
+                    message='Dynamic data without cache tags',
+                    suggestion='Add cacheTag() for granular cache invalidation'
+                ))
+
+    def analyze_revalidation(self, file_path, markers):
         """Analyze revalidation patterns."""
         # Check for Server Actions
-        has_use_server = "'use server'" in content or '"use server"' in content
+        has_use_server = 'use_server' in markers
 
         if has_use_server:
             # Check if Server Action performs mutations
-            has_mutations = any(pattern in content for pattern in [
-                r'\.create\(',
-                r'\.update\(',
-                r'\.delete\(',
-                r'\.insert\(',
-                'INSERT ',
-                'UPDATE ',
-                'DELETE '
-            ])
+            has_mutations = 'mutation' in markers
 
             if has_mutations:
                 # Check for revalidation calls
-                has_revalidate = 'revalidatePath' in content or 'revalidateTag' in content
+                has_revalidate = 'revalidate' in markers
 
                 if not has_revalidate:
-                    self.findings['warnings'].append({
-                        'file': str(file_path),
-                        'line': 1,
-                        'severity': 'high',
-                        'message': 'Server Action with mutations but no revalidation',
-                        'suggestion': 'Add revalidatePath() or revalidateTag() after mutations'
-                    })
+                    self.findings['warnings'].append(Finding(
+                        file=str(file_path),
+                        line=1,
+                        severity='high',
+                        message='Server Action with mutations but no revalidation',
+                        suggestion='Add revalidatePath() or revalidateTag() after mutations'
+                    ))
 
     def analyze_file(self, file_path):
         """Analyze a single file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        self.analyze_content(file_path, content)
+                else:
+                    self.analyze_content(file_path, f.read())
 
             self.file_count += 1
 
-            # Run all analyses
-            self.analyze_fetch_caching(file_path, content)
-            self.analyze_cache_components(file_path, content)
-            self.analyze_cache_life(file_path, content)
-            self.analyze_cache_tags(file_path, content)
-            self.analyze_revalidation(file_path, content)
-
         except Exception as e:
-            print(f"Warning: Could not analyze {file_path}: {e}")
+            self.errors.append(f"Warning: Could not analyze {file_path}: {e}")
+
+    def analyze_content(self, file_path, content):
+        """Run all analyses over a file's raw bytes (bytes or mmap)."""
+        lines = LineIndex(content)
+        markers, fetches, async_component = scan_content(content)
+
+        self.analyze_fetch_caching(file_path, fetches, lines)
+        self.analyze_cache_components(file_path, markers, async_component, lines)
+        self.analyze_cache_life(file_path, markers)
+        self.analyze_cache_tags(file_path, markers)
+        self.analyze_revalidation(file_path, markers)
+
+    def merge(self, file_count, findings, errors):
+        """Merge the results of analyze_path() into this analyzer."""
+        self.file_count += file_count
+        for category, items in findings.items():
+            self.findings[category].extend(items)
+        for error in errors:
+            print(error)
 
     def scan_directory(self):
         """Scan directory for cache patterns."""
         extensions = {'.tsx', '.jsx', '.ts', '.js'}
 
-        for file_path in self.directory.rglob('*'):
-            if file_path.suffix in extensions:
-                # Skip node_modules and build directories
-                if any(skip in file_path.parts for skip in ['node_modules', '.next', 'dist']):
-                    continue
-                self.analyze_file(file_path)
+        paths = []
+        for root, dirs, files in os.walk(self.directory):
+            # Prune node_modules and build directories so they are never descended into
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            root_path = Path(root)
+            for name in files:
+                if os.path.splitext(name)[1] in extensions:
+                    paths.append(root_path / name)
+
+        workers = worker_count()
+        if workers < 2 or len(paths) < 64:
+            # Not worth the process start-up cost
+            for file_path in paths:
+                self.merge(*analyze_path(file_path))
+            return
+
+        # Files are independent, so analyze them in parallel; map() keeps
+        # results in path order so the report is deterministic
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(analyze_path, paths, chunksize=16):
+                self.merge(*result)
 
     def print_report(self):
         """Print formatted report."""
@@ -206,8 +389,8 @@ class CacheAnalyzer:
             print(f"🟡 UNCACHED FETCH CALLS ({len(self.findings['uncached_fetches'])})")
             print("-" * 70)
             for finding in self.findings['uncached_fetches'][:5]:  # Show top 5
-                print(f"   {finding['file']}:{finding['line']}")
-                print(f"   💡 {finding['suggestion']}\n")
+                print(f"   {finding.file}:{finding.line}")
+                print(f"   💡 {finding.suggestion}\n")
             if len(self.findings['uncached_fetches']) > 5:
                 print(f"   ... and {len(self.findings['uncached_fetches']) - 5} more\n")
 
@@ -216,16 +399,16 @@ class CacheAnalyzer:
             print(f"🔴 MISSING CACHE COMPONENTS ({len(self.findings['missing_cache_components'])})")
             print("-" * 70)
             for finding in self.findings['missing_cache_components']:
-                print(f"   {finding['file']}:{finding['line']}")
-                print(f"   💡 {finding['suggestion']}\n")
+                print(f"   {finding.file}:{finding.line}")
+                print(f"   💡 {finding.suggestion}\n")
 
         # Missing cache tags
         if self.findings['missing_cache_tags']:
             print(f"🟢 OPTIMIZATION OPPORTUNITIES ({len(self.findings['missing_cache_tags'])})")
             print("-" * 70)
             for finding in self.findings['missing_cache_tags'][:3]:  # Show top 3
-                print(f"   {finding['file']}:{finding['line']}")
-                print(f"   💡 {finding['suggestion']}\n")
+                print(f"   {finding.file}:{finding.line}")
+                print(f"   💡 {finding.suggestion}\n")
 
         # Warnings
         if self.findings['warnings']:
@@ -236,10 +419,10 @@ class CacheAnalyzer:
                     'high': '🔴',
                     'medium': '🟡',
                     'low': '🟢'
-                }.get(finding['severity'], '⚪')
-                print(f"{severity_icon} {finding['message']}")
-                print(f"   {finding['file']}:{finding['line']}")
-                print(f"   💡 {finding['suggestion']}\n")
+                }.get(finding.severity, '⚪')
+                print(f"{severity_icon} {finding.message}")
+                print(f"   {finding.file}:{finding.line}")
+                print(f"   💡 {finding.suggestion}\n")
 
         # Optimal patterns found
         if self.findings['optimal_patterns']:
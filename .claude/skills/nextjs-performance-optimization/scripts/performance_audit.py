@@ -16,16 +16,40 @@ Examples:
 import os
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def format_size(bytes_size):
     """Convert bytes to human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.2f} {unit}"
-        bytes_size /= 1024.0
-    return f"{bytes_size:.2f} TB"
+    # Each unit is 2**10 times the previous one, so the unit index is
+    # the number of whole 10-bit groups above the lowest bit
+    scale = min(max(0, (int(bytes_size).bit_length() - 1) // 10), len(SIZE_UNITS) - 1)
+    return f"{bytes_size / (1 << (scale * 10)):.2f} {SIZE_UNITS[scale]}"
+
+
+def walk_files(root, suffix):
+    """Yield (path, size) for every file under root ending with suffix, in Path.rglob's order."""
+    subdirs = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith(suffix):
+                yield entry.path, entry.stat().st_size
+
+    for subdir in subdirs:
+        yield from walk_files(subdir, suffix)
+
+
+def scan_files(root, suffix):
+    """List (path, size) for files under root ending with suffix, or [] if root is missing."""
+    if not os.path.isdir(root):
+        return []
+    return list(walk_files(root, suffix))
 
 
 def analyze_build_output(build_dir):
@@ -46,42 +70,42 @@ def analyze_build_output(build_dir):
         'recommendations': []
     }
 
-    # Analyze static directory
     static_dir = build_path / 'static'
-    if static_dir.exists():
-        # Check JS bundles
-        chunks_dir = static_dir / 'chunks'
-        if chunks_dir.exists():
-            for js_file in chunks_dir.rglob('*.js'):
-                size = js_file.stat().st_size
-                results['js_bundles'].append({
-                    'name': js_file.name,
-                    'size': size,
-                    'path': str(js_file.relative_to(build_path))
-                })
-                results['total_size'] += size
-
-        # Check CSS bundles
-        css_dir = static_dir / 'css'
-        if css_dir.exists():
-            for css_file in css_dir.rglob('*.css'):
-                size = css_file.stat().st_size
-                results['css_bundles'].append({
-                    'name': css_file.name,
-                    'size': size,
-                    'path': str(css_file.relative_to(build_path))
-                })
-                results['total_size'] += size
+    chunks_dir = static_dir / 'chunks'
+    css_dir = static_dir / 'css'
+    server_dir = build_path / 'server' / 'app'
+
+    # The three subtrees are independent, so walk them concurrently to
+    # overlap their directory reads and stats
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        js_scan = executor.submit(scan_files, chunks_dir, '.js')
+        css_scan = executor.submit(scan_files, css_dir, '.css')
+        page_scan = executor.submit(scan_files, server_dir, '.js')
+
+    # Check JS bundles
+    for js_file, size in js_scan.result():
+        results['js_bundles'].append({
+            'name': os.path.basename(js_file),
+            'size': size,
+            'path': os.path.relpath(js_file, build_path)
+        })
+        results['total_size'] += size
+
+    # Check CSS bundles
+    for css_file, size in css_scan.result():
+        results['css_bundles'].append({
+            'name': os.path.basename(css_file),
+            'size': size,
+            'path': os.path.relpath(css_file, build_path)
+        })
+        results['total_size'] += size
 
     # Analyze pages
-    server_dir = build_path / 'server' / 'app'
-    if server_dir.exists():
-        for page_file in server_dir.rglob('*.js'):
-            size = page_file.stat().st_size
-            results['pages'].append({
-                'name': str(page_file.relative_to(server_dir)),
-                'size': size
-            })
+    for page_file, size in page_scan.result():
+        results['pages'].append({
+            'name': os.path.relpath(page_file, server_dir),
+            'size': size
+        })
 
     # Generate recommendations
     generate_recommendations(results)
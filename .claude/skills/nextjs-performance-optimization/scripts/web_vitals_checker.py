@@ -13,63 +13,337 @@ Examples:
     python web_vitals_checker.py src
 """
 
+import bisect
+import hashlib
+import itertools
+import json
 import os
 import re
+import sqlite3
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+from typing import IO, Any, Dict, Final, Iterator, List, Match, Optional, Sequence, Set, Tuple, Union
+
+# One finding as reported: file, issue, line, severity, fix
+Finding = Dict[str, Any]
+# Findings grouped by metric
+Findings = Dict[str, List[Finding]]
+
+
+# Bytes patterns, since source files are never decoded.
+#
+# All <Image> checks share one pass over the file: IMAGE_TAG_RE extracts each
+# tag and the LCP/CLS checks inspect the tag text.
+IMAGE_TAG_RE: Final = re.compile(rb'<Image\b[^>]*>')
+HERO_SRC_RE: Final = re.compile(rb'src=["\'][^"\']*hero[^"\']*["\']', re.IGNORECASE)
+GOOGLE_FONT_IMPORT_RE: Final = re.compile(rb'import.*from ["\']next/font/google["\']')
+if sys.version_info >= (3, 11):
+    # Possessive quantifiers stop a failed match from backtracking through a
+    # long brace or statement body. Every one is followed by a character its
+    # class cannot match, so they never change what matches.
+    HEAVY_LOOP_RE: Final = re.compile(rb'for\s*+\([^)]*+\)\s*+{([^}]{200,}+)}')
+    EXPENSIVE_FUNCTION_RE: Final = re.compile(rb'const\s++\w++\s*+=\s*+\([^)]*+\)\s*+=>\s*+{([^}]{500,}+)}')
+    SEQUENTIAL_AWAITS_RE: Final = re.compile(rb'await\s++fetch[^;]++;\s*+await\s++fetch')
+else:
+    HEAVY_LOOP_RE: Final = re.compile(rb'for\s*\([^)]*\)\s*{([^}]{200,})}')
+    EXPENSIVE_FUNCTION_RE: Final = re.compile(rb'const\s+\w+\s*=\s*\([^)]*\)\s*=>\s*{([^}]{500,})}')
+    SEQUENTIAL_AWAITS_RE: Final = re.compile(rb'await\s+fetch[^;]+;\s*await\s+fetch')
+UNCACHED_FETCH_RE: Final = re.compile(rb'fetch\([^)]+\)(?!\s*,\s*{[^}]*cache)')
+
+# Imports that defeat tree-shaking, scanned in one pass and dispatched on the
+# named group that matched: group -> (library, fix)
+HEAVY_IMPORT_RE: Final = re.compile(
+    rb'import\s+(?:'
+    rb'(?P<mui>{[^}]+}\s+from\s+["\']@mui/material["\'])'
+    rb'|(?P<lodash>{[^}]+}\s+from\s+["\']lodash["\'])'
+    rb'|(?P<namespace>\*\s+as\s+\w+\s+from)'
+    rb')'
+)
+HEAVY_IMPORTS: Final = {
+    'mui': ('@mui/material', 'Import specific components'),
+    'lodash': ('lodash', 'Use lodash-es or import specific functions'),
+    'namespace': ('namespace import', 'Avoid namespace imports for better tree-shaking'),
+}
+
+# Libraries that should be loaded with next/dynamic in client components
+HEAVY_LIBS: Final = ('chart', 'editor', 'pdf', 'map', 'markdown')
+HEAVY_LIB_NEEDLES: Final = tuple((lib, lib.encode()) for lib in HEAVY_LIBS)
+
+# Directories never descended into while scanning
+SKIP_DIRS: Final = {'node_modules', '.next', '.git'}
+SOURCE_EXTENSIONS: Final = ('.tsx', '.jsx', '.ts', '.js')
+
+NEWLINE_RE: Final = re.compile(rb'\n')
+
+# Report formatting, shared by every finding printed
+SEVERITY_ICONS: Final = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
+ISSUE_FORMAT: Final = "{icon} {issue}\n   File: {file}:{line}\n   Fix: {fix}\n\n"
+
+# Findings of unchanged files are reused across runs from this SQLite file,
+# kept in the user's cache directory rather than in the scanned project
+CACHE_FILE: Final = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'yi-connect',
+    'web_vitals.sqlite',
+)
+
+
+def newline_offsets(content: bytes) -> List[int]:
+    """Newline positions in content, ascending; see line_number()."""
+    return [match.start() for match in NEWLINE_RE.finditer(content)]
+
+
+def line_number(newlines: List[int], offset: int) -> int:
+    """1-based line of a byte offset, given newline_offsets() of the same content."""
+    return bisect.bisect_left(newlines, offset) + 1
+
+
+def char_length(span: bytes) -> int:
+    """
+    Length in characters of a UTF-8 byte span as text-mode reading would see it
+    (CRLF counted as one newline); body-size thresholds count characters.
+    """
+    return len(span.decode('utf-8', 'replace')) - span.count(b'\r\n')
+
+
+def walk_sources(root: Union[str, Path]) -> Iterator[str]:
+    """Yield the path of every source file under root, never entering SKIP_DIRS."""
+    subdirs = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(SOURCE_EXTENSIONS):
+                yield entry.path
+
+    for subdir in subdirs:
+        yield from walk_sources(subdir)
+
+
+def worker_count() -> int:
+    """Pool size for the scan: the CPUs in this process's affinity mask."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def analyze_source(file_path: Path, content: bytes) -> Tuple[Findings, List[str]]:
+    """
+    Analyze one file's bytes on a fresh checker (the pool's worker entry point).
+    """
+    checker = WebVitalsChecker(file_path)
+    checker.analyze_content(file_path, content)
+    return checker.findings, checker.errors
+
+
+def content_key(salt: bytes, file_path: Path, content: bytes) -> bytes:
+    """Findings cache key; the suffix is included since it selects the checks."""
+    digest = hashlib.sha256(salt)
+    digest.update(file_path.suffix.encode() + b'\0')
+    digest.update(content)
+    return digest.digest()
+
+
+def analyze_path(file_path: Path, salt: Optional[bytes]) -> Tuple[Optional[bytes], Optional[Findings], List[str]]:
+    """
+    Read and analyze one file, so only its path crosses to a worker process.
+    Returns (key, findings, errors): the cache key of the bytes actually
+    analyzed (None without a salt), since the file may have changed after
+    it was hashed for the lookup, and None findings if it could not be read.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            content = f.read()
+    except OSError as e:
+        return None, None, [f"Warning: Could not analyze {file_path}: {e}"]
+    findings, errors = analyze_source(file_path, content)
+    return (content_key(salt, file_path, content) if salt else None), findings, errors
+
+
+class FindingsCache:
+    """
+    Persistent store of per-file findings keyed on SHA-256 of the file's bytes,
+    partitioned by scanned root. Keys are salted with this script's own source,
+    so editing any check invalidates every entry. Entries omit the file path,
+    which is filled back in on lookup since identical content can live at
+    several paths. A database error (e.g. the file locked by a concurrent run)
+    turns the cache off for the rest of the run instead of failing the scan.
+    """
+
+    def __init__(self, path: str, root: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn: Optional[sqlite3.Connection] = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS findings '
+            '(root TEXT, hash BLOB, data BLOB, PRIMARY KEY (root, hash))'
+        )
+        self.root = root
+        # Keys of the files present in this run; close() prunes the rest
+        self.seen: Set[bytes] = set()
+        with open(__file__, 'rb') as f:
+            self.salt = hashlib.sha256(f.read()).digest()
+
+    def key(self, file_path: Path, content: bytes) -> bytes:
+        """Cache key for content, marked as seen in this run."""
+        key = content_key(self.salt, file_path, content)
+        self.seen.add(key)
+        return key
+
+    def disable(self) -> None:
+        """Stop using the database for the rest of the run."""
+        if self.conn is not None:
+            try:
+                self.conn.close()
+            except sqlite3.Error:
+                pass
+            self.conn = None
+
+    def lookup(self, key: bytes) -> Optional[str]:
+        """Return the stored data for key, or None on a miss or database error."""
+        if self.conn is None:
+            return None
+        try:
+            row = self.conn.execute(
+                'SELECT data FROM findings WHERE root = ? AND hash = ?', (self.root, key)
+            ).fetchone()
+        except sqlite3.Error:
+            self.disable()
+            return None
+        return None if row is None else row[0]
+
+    def decode(self, data: str, file_path: Path) -> Findings:
+        """Rebuild the findings stored as data for the file at file_path."""
+        return {
+            metric: [
+                {'file': str(file_path), 'issue': issue, 'line': line, 'severity': severity, 'fix': fix}
+                for issue, line, severity, fix in issues
+            ]
+            for metric, issues in json.loads(data).items()
+        }
+
+    def put(self, key: bytes, findings: Findings) -> None:
+        """Store one file's findings under key, marking it as seen."""
+        self.seen.add(key)
+        if self.conn is None:
+            return
+        data = {
+            metric: [[i['issue'], i['line'], i['severity'], i['fix']] for i in issues]
+            for metric, issues in findings.items()
+        }
+        try:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO findings VALUES (?, ?, ?)', (self.root, key, json.dumps(data))
+            )
+        except sqlite3.Error:
+            self.disable()
+
+    def close(self) -> None:
+        """
+        Drop this root's entries for files not seen in this run, then commit
+        everything in one transaction.
+        """
+        if self.conn is None:
+            return
+        try:
+            self.conn.execute('CREATE TEMP TABLE live (hash BLOB PRIMARY KEY)')
+            self.conn.executemany('INSERT OR IGNORE INTO live VALUES (?)', ((key,) for key in self.seen))
+            self.conn.execute(
+                'DELETE FROM findings WHERE root = ? AND hash NOT IN (SELECT hash FROM live)', (self.root,)
+            )
+            self.conn.commit()
+        except sqlite3.Error:
+            pass
+        self.disable()
+
+
+class FindingsSpool:
+    """
+    Report findings spilled to one temporary JSON-lines file per metric as
+    they are merged, so memory stays flat however many findings a scan
+    produces. Totals are counted on the way in; the report replays each
+    metric's file in arrival order.
+    """
+
+    def __init__(self) -> None:
+        self.files: Dict[str, IO[str]] = {}
+        self.counts: Counter[str] = Counter()
+        self.critical: Counter[str] = Counter()
+
+    def add(self, metric: str, issue: Finding) -> None:
+        """Append one finding under metric."""
+        if metric not in self.files:
+            self.files[metric] = tempfile.TemporaryFile('w+', encoding='utf-8')
+        self.files[metric].write(json.dumps(issue) + '\n')
+        self.counts[metric] += 1
+        if issue['severity'] == 'high':
+            self.critical[metric] += 1
+
+    def issues(self, metric: str) -> Iterator[Finding]:
+        """Yield the findings spooled under metric, oldest first."""
+        spool_file = self.files[metric]
+        spool_file.seek(0)
+        for line in spool_file:
+            yield json.loads(line)
 
 
 class WebVitalsChecker:
-    def __init__(self, directory):
+    def __init__(self, directory: Union[str, Path]) -> None:
         self.directory = Path(directory)
-        self.findings = defaultdict(list)
+        # Scratch findings of analyze_content(), handed back by
+        # analyze_source(); everything reported is merged into the spool
+        self.findings: Findings = defaultdict(list)
+        self.spool = FindingsSpool()
         self.file_count = 0
+        self.errors: List[str] = []
 
-    def check_lcp_issues(self, file_path, content):
+    def check_lcp_issues(self, file_path: Path, content: bytes, newlines: List[int], images: Sequence[Match[bytes]]) -> None:
         """Check for Largest Contentful Paint issues."""
         # Check for missing priority on hero images
-        img_pattern = r'<Image[^>]*src=["\'][^"\']*hero[^"\']*["\'][^>]*>'
-        for match in re.finditer(img_pattern, content, re.IGNORECASE):
-            if 'priority' not in match.group() and 'preload' not in match.group():
+        for match in images:
+            tag = match.group()
+            if HERO_SRC_RE.search(tag) and b'priority' not in tag and b'preload' not in tag:
                 self.findings['LCP'].append({
                     'file': str(file_path),
                     'issue': 'Hero image missing priority/preload',
-                    'line': content[:match.start()].count('\n') + 1,
+                    'line': line_number(newlines, match.start()),
                     'severity': 'high',
                     'fix': 'Add priority={true} to Image component'
                 })
 
         # Check for large images without size optimization
-        img_without_quality = r'<Image[^>]*(?!quality=)[^>]*>'
-        for match in re.finditer(img_without_quality, content):
-            if 'src=' in match.group():
+        for match in images:
+            tag = match.group()
+            if b'src=' in tag and b'quality=' not in tag:
                 self.findings['LCP'].append({
                     'file': str(file_path),
                     'issue': 'Image without quality optimization',
-                    'line': content[:match.start()].count('\n') + 1,
+                    'line': line_number(newlines, match.start()),
                     'severity': 'medium',
                     'fix': 'Consider adding quality={85} for optimized images'
                 })
 
-    def check_cls_issues(self, file_path, content):
+    def check_cls_issues(self, file_path: Path, content: bytes, newlines: List[int], images: Sequence[Match[bytes]]) -> None:
         """Check for Cumulative Layout Shift issues."""
         # Check for images without dimensions
-        img_without_dimensions = r'<Image[^>]*src=[^>]*(?!width=)(?!height=)[^>]*/?>'
-        for match in re.finditer(img_without_dimensions, content):
-            if 'fill' not in match.group():
+        for match in images:
+            tag = match.group()
+            if b'src=' in tag and b'fill' not in tag and (b'width=' not in tag or b'height=' not in tag):
                 self.findings['CLS'].append({
                     'file': str(file_path),
                     'issue': 'Image without width/height',
-                    'line': content[:match.start()].count('\n') + 1,
+                    'line': line_number(newlines, match.start()),
                     'severity': 'high',
                     'fix': 'Add width and height props to prevent layout shift'
                 })
 
         # Check for fonts without display swap
-        font_without_display = r'import.*from ["\']next/font/google["\']'
-        if re.search(font_without_display, content):
-            if 'display:' not in content and "display:" not in content:
+        if b'next/font/google' in content and GOOGLE_FONT_IMPORT_RE.search(content):
+            if b'display:' not in content:
                 self.findings['CLS'].append({
                     'file': str(file_path),
                     'issue': 'Font without display strategy',
@@ -78,86 +352,91 @@ class WebVitalsChecker:
                     'fix': "Add display: 'swap' to font configuration"
                 })
 
-    def check_fid_issues(self, file_path, content):
+    def check_fid_issues(self, file_path: Path, content: bytes, newlines: List[int]) -> None:
         """Check for First Input Delay issues."""
         # Check for heavy computation in render
-        heavy_loops = r'for\s*\([^)]*\)\s*{[^}]{200,}}'
-        for match in re.finditer(heavy_loops, content):
+        loops = HEAVY_LOOP_RE.finditer(content) if b'for' in content else ()
+        for match in loops:
+            if char_length(match.group(1)) < 200:
+                continue
             self.findings['FID'].append({
                 'file': str(file_path),
                 'issue': 'Heavy computation in render path',
-                'line': content[:match.start()].count('\n') + 1,
+                'line': line_number(newlines, match.start()),
                 'severity': 'medium',
                 'fix': 'Consider using useMemo or moving to Server Component'
             })
 
         # Check for missing memoization on expensive functions
-        expensive_pattern = r'const\s+\w+\s*=\s*\([^)]*\)\s*=>\s*{[^}]{500,}}'
-        for match in re.finditer(expensive_pattern, content):
-            if 'useMemo' not in content[:match.start()]:
+        first_use_memo = content.find(b'useMemo')
+        functions = EXPENSIVE_FUNCTION_RE.finditer(content) if b'=>' in content else ()
+        for match in functions:
+            if char_length(match.group(1)) < 500:
+                continue
+            if first_use_memo == -1 or first_use_memo + len(b'useMemo') > match.start():
                 self.findings['FID'].append({
                     'file': str(file_path),
                     'issue': 'Potentially expensive function without memoization',
-                    'line': content[:match.start()].count('\n') + 1,
+                    'line': line_number(newlines, match.start()),
                     'severity': 'low',
                     'fix': 'Consider wrapping with useMemo if recalculated frequently'
                 })
 
-    def check_ttfb_issues(self, file_path, content):
+    def check_ttfb_issues(self, file_path: Path, content: bytes, newlines: List[int]) -> None:
         """Check for Time to First Byte issues."""
         # Check for blocking data fetches
-        if 'async function' in content and 'await fetch' in content:
-            # Check for sequential awaits
-            sequential_awaits = r'await\s+fetch[^;]+;\s*await\s+fetch'
-            for match in re.finditer(sequential_awaits, content):
+        if b'async function' in content and b'await fetch' in content:
+            # Check for sequential awaits; a match can only start at an await,
+            # so the regex skips everything before the first one
+            for match in SEQUENTIAL_AWAITS_RE.finditer(content, content.find(b'await')):
                 self.findings['TTFB'].append({
                     'file': str(file_path),
                     'issue': 'Sequential fetch calls blocking render',
-                    'line': content[:match.start()].count('\n') + 1,
+                    'line': line_number(newlines, match.start()),
                     'severity': 'high',
                     'fix': 'Use Promise.all() to parallelize fetch requests'
                 })
 
         # Check for missing cache configuration
-        if 'fetch(' in content:
-            # Simple check for fetch without cache config
-            fetch_pattern = r'fetch\([^)]+\)(?!\s*,\s*{[^}]*cache)'
-            matches = list(re.finditer(fetch_pattern, content))
-            if matches and 'next:' not in content:
+        if b'fetch(' in content and b'next:' not in content:
+            # Simple check for fetch without cache config; only the first
+            # uncached fetch is reported, so stop at it
+            uncached = UNCACHED_FETCH_RE.search(content, content.find(b'fetch('))
+            if uncached:
                 self.findings['TTFB'].append({
                     'file': str(file_path),
                     'issue': 'Fetch without cache configuration',
-                    'line': content[:matches[0].start()].count('\n') + 1,
+                    'line': line_number(newlines, uncached.start()),
                     'severity': 'medium',
                     'fix': 'Add cache configuration: { next: { revalidate: 3600 } }'
                 })
 
-    def check_bundle_size_issues(self, file_path, content):
+    def check_bundle_size_issues(self, file_path: Path, content: bytes, newlines: List[int]) -> None:
         """Check for patterns that increase bundle size."""
         # Check for full library imports
-        heavy_imports = [
-            (r'import\s+{[^}]+}\s+from\s+["\']@mui/material["\']', '@mui/material', 'Import specific components'),
-            (r'import\s+{[^}]+}\s+from\s+["\']lodash["\']', 'lodash', 'Use lodash-es or import specific functions'),
-            (r'import\s+\*\s+as\s+\w+\s+from', 'namespace import', 'Avoid namespace imports for better tree-shaking'),
-        ]
-
-        for pattern, lib, fix in heavy_imports:
-            for match in re.finditer(pattern, content):
+        # Bucket matches per kind so findings stay grouped by library
+        heavy_imports: Dict[Optional[str], List[Match[bytes]]] = {kind: [] for kind in HEAVY_IMPORTS}
+        if b'import' in content:
+            for match in HEAVY_IMPORT_RE.finditer(content):
+                heavy_imports[match.lastgroup].append(match)
+
+        for kind, (lib, fix) in HEAVY_IMPORTS.items():
+            for match in heavy_imports[kind]:
                 self.findings['Bundle Size'].append({
                     'file': str(file_path),
                     'issue': f'Non-optimized import from {lib}',
-                    'line': content[:match.start()].count('\n') + 1,
+                    'line': line_number(newlines, match.start()),
                     'severity': 'medium',
                     'fix': fix
                 })
 
         # Check for missing dynamic imports on heavy components
-        if "'use client'" in content or '"use client"' in content:
+        if b"'use client'" in content or b'"use client"' in content:
             # Check for heavy libraries in client components
-            heavy_libs = ['chart', 'editor', 'pdf', 'map', 'markdown']
-            for lib in heavy_libs:
-                if lib.lower() in content.lower():
-                    if 'dynamic(' not in content:
+            if b'dynamic(' not in content:
+                lowered = content.lower()
+                for lib, needle in HEAVY_LIB_NEEDLES:
+                    if needle in lowered:
                         self.findings['Bundle Size'].append({
                             'file': str(file_path),
                             'issue': f'Heavy library ({lib}) in client component without dynamic import',
@@ -167,39 +446,117 @@ class WebVitalsChecker:
                         })
                         break
 
-    def analyze_file(self, file_path):
-        """Analyze a single file for Web Vitals issues."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
+    def analyze_file(self, file_path: Path) -> None:
+        """Analyze a single file for Web Vitals issues and add them to the report."""
+        _, findings, errors = analyze_path(file_path, None)
+        for error in errors:
+            print(error)
+        if findings is not None:
             self.file_count += 1
+            self.merge(findings)
+
+    def analyze_content(self, file_path: Path, content: bytes) -> None:
+        """Run all checks over a file's raw bytes."""
+        try:
+            newlines = newline_offsets(content)
 
             # Run all checks
             if file_path.suffix in ['.tsx', '.jsx']:
-                self.check_lcp_issues(file_path, content)
-                self.check_cls_issues(file_path, content)
-                self.check_fid_issues(file_path, content)
+                images = list(IMAGE_TAG_RE.finditer(content)) if b'<Image' in content else []
+                self.check_lcp_issues(file_path, content, newlines, images)
+                self.check_cls_issues(file_path, content, newlines, images)
+                self.check_fid_issues(file_path, content, newlines)
 
             if file_path.suffix in ['.tsx', '.jsx', '.ts', '.js']:
-                self.check_ttfb_issues(file_path, content)
-                self.check_bundle_size_issues(file_path, content)
+                self.check_ttfb_issues(file_path, content, newlines)
+                self.check_bundle_size_issues(file_path, content, newlines)
 
         except Exception as e:
-            print(f"Warning: Could not analyze {file_path}: {e}")
+            self.errors.append(f"Warning: Could not analyze {file_path}: {e}")
 
-    def scan_directory(self):
+    def merge(self, findings: Findings) -> None:
+        """Spool one file's findings into the report."""
+        for metric, issues in findings.items():
+            for issue in issues:
+                self.spool.add(metric, issue)
+
+    def scan_directory(self) -> None:
         """Scan directory for performance issues."""
-        extensions = {'.tsx', '.jsx', '.ts', '.js'}
+        if not self.directory.is_dir():
+            return
+        paths = [Path(path) for path in walk_sources(self.directory)]
 
-        for file_path in self.directory.rglob('*'):
-            if file_path.suffix in extensions:
-                # Skip node_modules and .next
-                if 'node_modules' in file_path.parts or '.next' in file_path.parts:
+        try:
+            cache: Optional[FindingsCache] = FindingsCache(CACHE_FILE, os.path.abspath(self.directory))
+        except (OSError, sqlite3.Error):
+            # Read-only or locked location: analyze everything afresh
+            cache = None
+
+        # (path, cached data) per file; data is None for the misses, which
+        # are the only files analyzed. Files are hashed one at a time and
+        # their bytes dropped, so memory does not grow with the tree.
+        entries: List[Tuple[Path, Optional[str]]] = []
+        for file_path in paths:
+            data = None
+            if cache:
+                try:
+                    with open(file_path, 'rb') as f:
+                        key = cache.key(file_path, f.read())
+                except OSError as e:
+                    print(f"Warning: Could not analyze {file_path}: {e}")
                     continue
-                self.analyze_file(file_path)
+                data = cache.lookup(key)
+            entries.append((file_path, data))
+
+        # Misses are passed by path and read again where they are analyzed
+        misses = [file_path for file_path, data in entries if data is None]
+        salt = cache.salt if cache else None
+        workers = worker_count()
+        if workers < 2 or len(misses) < 64:
+            # Too few misses to pay for starting worker processes
+            analyzed: Iterator[Tuple[Optional[bytes], Optional[Findings], List[str]]] = (
+                analyze_path(file_path, salt) for file_path in misses
+            )
+            self.merge_in_order(entries, analyzed, cache)
+        else:
+            # map() yields in submission order, which merge_in_order relies on
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                analyzed = executor.map(analyze_path, misses, itertools.repeat(salt), chunksize=16)
+                self.merge_in_order(entries, analyzed, cache)
+
+        if cache:
+            cache.close()
+
+    def merge_in_order(
+        self,
+        entries: List[Tuple[Path, Optional[str]]],
+        analyzed: Iterator[Tuple[Optional[bytes], Optional[Findings], List[str]]],
+        cache: Optional[FindingsCache],
+    ) -> None:
+        """
+        Merge cached and freshly analyzed findings in path order, as each
+        arrives. analyzed yields analyze_path() results for the uncached
+        entries, in order; error-free ones are stored in the cache.
+        """
+        for file_path, data in entries:
+            if data is not None:
+                # Only cache hits carry data
+                assert cache is not None
+                self.file_count += 1
+                self.merge(cache.decode(data, file_path))
+                continue
+
+            key, findings, errors = next(analyzed)
+            for error in errors:
+                print(error)
+            if findings is None:
+                continue
+            self.file_count += 1
+            if cache and key is not None and not errors:
+                cache.put(key, findings)
+            self.merge(findings)
 
-    def print_report(self):
+    def print_report(self) -> None:
         """Print formatted report."""
         print("\n" + "="*70)
         print("  CORE WEB VITALS ANALYSIS REPORT")
@@ -207,32 +564,25 @@ class WebVitalsChecker:
 
         print(f"📁 Files Analyzed: {self.file_count}\n")
 
-        if not any(self.findings.values()):
+        spool = self.spool
+        if not spool.counts:
             print("✅ No Web Vitals issues detected!\n")
             return
 
         # Group by metric
         for metric in ['LCP', 'CLS', 'FID', 'TTFB', 'Bundle Size']:
-            if metric in self.findings and self.findings[metric]:
-                issues = self.findings[metric]
-                print(f"{'🔴' if any(i['severity'] == 'high' for i in issues) else '🟡'} {metric} Issues ({len(issues)})")
+            if spool.counts[metric]:
+                print(f"{'🔴' if spool.critical[metric] else '🟡'} {metric} Issues ({spool.counts[metric]})")
                 print("-" * 70)
 
-                for issue in issues:
-                    severity_icon = {
-                        'high': '🔴',
-                        'medium': '🟡',
-                        'low': '🟢'
-                    }.get(issue['severity'], '⚪')
-
-                    print(f"{severity_icon} {issue['issue']}")
-                    print(f"   File: {issue['file']}:{issue['line']}")
-                    print(f"   Fix: {issue['fix']}")
-                    print()
+                sys.stdout.writelines(
+                    ISSUE_FORMAT.format(icon=SEVERITY_ICONS.get(issue['severity'], '⚪'), **issue)
+                    for issue in spool.issues(metric)
+                )
 
         # Summary
-        total_issues = sum(len(issues) for issues in self.findings.values())
-        critical = sum(1 for issues in self.findings.values() for i in issues if i['severity'] == 'high')
+        total_issues = sum(spool.counts.values())
+        critical = sum(spool.critical.values())
 
         print("="*70)
         print(f"  Total Issues: {total_issues} | Critical: {critical}")
@@ -245,7 +595,7 @@ class WebVitalsChecker:
         print("4. Monitor Core Web Vitals in production with analytics\n")
 
 
-def main():
+def main() -> None:
     """Main entry point."""
     directory = sys.argv[1] if len(sys.argv) > 1 else 'app'
 
@@ -19,250 +19,471 @@ Examples:
 
 import sys
 import os
-from pathlib import Path
+import json
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson parses package.json bytes several times faster when installed;
+# the standard library parser is the fallback, so it is never required
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Directories checked by check_directory_structure, split once at import
+# into (parent, name) so each check is a lookup in the parent's listing, and
+# paired with their report messages so the check formats nothing per run
+REQUIRED_DIRS = tuple(os.path.split(path) + (
+    f"Directory exists: {path}",
+    f"Missing required directory: {path}",
+) for path in (
+    'app',
+    'app/actions',
+    'lib/supabase',
+    'lib/data',
+    'lib/utils',
+    'components',
+    'types',
+))
+
+RECOMMENDED_DIRS = tuple(os.path.split(path) + (
+    f"Recommended directory missing: {path}",
+) for path in (
+    'app/(auth)',
+    'app/(dashboard)',
+    'app/api',
+    'lib/validations',
+    'lib/hooks',
+    'components/ui',
+    'components/shared',
+    'components/forms',
+    'config',
+))
+
+# Markers the checks look for in file contents, matched as raw bytes
+CACHE_COMPONENTS_ENABLED = b'cacheComponents: true'
+CACHE_LIFE = b'cacheLife'
+SERVER_CLIENT_FACTORY = b'createServerClient'
+SUPABASE_SSR_IMPORT = b'@supabase/ssr'
+BROWSER_CLIENT_FACTORY = b'createBrowserClient'
+GET_CURRENT_USER = b'getCurrentUser'
+REQUIRE_AUTH = b'requireAuth'
+SUPABASE_URL_VAR = b'NEXT_PUBLIC_SUPABASE_URL'
+SUPABASE_ANON_KEY_VAR = b'NEXT_PUBLIC_SUPABASE_ANON_KEY'
+
+# Dependencies checked by check_package_json, in report order, with frozen
+# sets alongside so the missing ones come out of one C-level set difference
+REQUIRED_DEPS = (
+    'next',
+    '@supabase/supabase-js',
+    '@supabase/ssr',
+    'zod',
+)
+REQUIRED_DEP_NAMES = frozenset(REQUIRED_DEPS)
+
+RECOMMENDED_DEPS = (
+    'react-hook-form',
+    '@hookform/resolvers',
+    'clsx',
+    'tailwind-merge',
+)
+RECOMMENDED_DEP_NAMES = frozenset(RECOMMENDED_DEPS)
+
+# Results of earlier runs, reused while nothing the checks look at changes
+CACHE_FILE = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'yi-connect',
+    'validator.json',
+)
+
+# Directories whose listings the checks consult, parents before children
+LISTED_DIRS = (
+    '',
+    'app',
+    'lib',
+    'lib/utils',
+    'components',
+)
+
+# Every project-relative path whose state can change the results: the
+# listed directories (an entry added or removed bumps their mtime) and the
+# files whose contents are read
+TRIGGER_PATHS = LISTED_DIRS + (
+    'next.config.ts',
+    'next.config.js',
+    'lib/supabase/server.ts',
+    'lib/supabase/client.ts',
+    'lib/auth.ts',
+    '.env.local',
+    'package.json',
+)
+
+class ResultsCache:
+    """
+    On-disk map from project path to the results of its last run, stored
+    with a key hashed from the stat of every trigger path. Keys are salted
+    with this script's own source, so editing any check invalidates them.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        try:
+            with open(path, 'rb') as f:
+                entries = json_loads(f.read())
+        except (OSError, ValueError):
+            entries = None
+        # A corrupted or foreign file is treated as an empty cache
+        self.entries = entries if isinstance(entries, dict) else {}
+        with open(__file__, 'rb') as f:
+            self.salt = hashlib.sha256(f.read()).digest()
+        self.newest_mtime_ns = 0
+
+    def key(self, project_path):
+        """Hash the (mode, inode, size, mtime) of each trigger path"""
+        digest = hashlib.sha256(self.salt)
+        for rel_path in TRIGGER_PATHS:
+            try:
+                st = os.stat(os.path.join(project_path, rel_path))
+            except OSError:
+                digest.update(b'-\0')
+                continue
+            digest.update(f"{st.st_mode} {st.st_ino} {st.st_size} {st.st_mtime_ns}\0".encode())
+            self.newest_mtime_ns = max(self.newest_mtime_ns, st.st_mtime_ns)
+        return digest.hexdigest()
+
+    def get(self, project_path, key):
+        """Return the cached (passed, warnings, errors), or None on a miss"""
+        entry = self.entries.get(project_path)
+        if not isinstance(entry, dict) or entry.get('key') != key:
+            return None
+        results = entry.get('passed'), entry.get('warnings'), entry.get('errors')
+        if not all(isinstance(items, list) for items in results):
+            return None
+        return results
+
+    def put(self, project_path, key, passed, warnings, errors):
+        """Store a run's results, unless a trigger path changed too recently"""
+        # A write in the same timestamp tick as the stat would leave the key
+        # unchanged, so results over freshly modified files are not kept
+        if time.time_ns() - self.newest_mtime_ns < 1_000_000_000:
+            return
+        self.entries[project_path] = {
+            'key': key,
+            'passed': passed,
+            'warnings': warnings,
+            'errors': errors,
+        }
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # Unwritable cache location: the next run just validates afresh
+            pass
 
 class ProjectValidator:
+    # Independent checks, each returning its (errors, warnings, passed)
+    # lists, in the order their results are reported
+    CHECKS = (
+        'check_directory_structure',
+        'check_next_config',
+        'check_supabase_setup',
+        'check_utilities',
+        'check_env_files',
+        'check_package_json',
+    )
+
     def __init__(self, project_path):
-        self.project_path = Path(project_path).resolve()
+        # Kept as a plain str: os.path joins skip pathlib's object overhead.
+        # Made absolute lexically; resolving symlinks would cost an lstat per
+        # path component, and every later lookup follows them anyway
+        self.project_path = os.path.abspath(project_path)
         self.errors = []
         self.warnings = []
         self.passed = []
+        # Directory listings by project-relative path, so every check on
+        # entries sharing a parent costs one scandir instead of one stat each
+        self._listings = {}
+
+    def _listdir_cached(self, rel_dir):
+        """
+        Entries of a project-relative directory (empty if missing), mapping
+        each name to its (is_dir, is_file) bits. The bits come from the
+        directory listing itself, so only symlinks cost a stat to answer.
+        """
+        entries = self._listings.get(rel_dir)
+        if entries is None:
+            entries = {}
+            try:
+                with os.scandir(os.path.join(self.project_path, rel_dir)) as it:
+                    for entry in it:
+                        is_dir = entry.is_dir()
+                        is_file = entry.is_file()
+                        # Match Path.exists(): a dangling symlink does not exist
+                        if is_dir or is_file or not entry.is_symlink():
+                            entries[entry.name] = (is_dir, is_file)
+            except OSError:
+                pass
+            self._listings[rel_dir] = entries
+        return entries
+
+    def exists(self, rel_path):
+        """Whether a project-relative path exists, answered from its parent's listing"""
+        parent, name = os.path.split(rel_path)
+        return name in self._listdir_cached(parent)
+
+    def is_dir(self, rel_path):
+        """Whether a project-relative path is a directory (following symlinks)"""
+        parent, name = os.path.split(rel_path)
+        return self._listdir_cached(parent).get(name, (False, False))[0]
+
+    def is_file(self, rel_path):
+        """Whether a project-relative path is a regular file (following symlinks)"""
+        parent, name = os.path.split(rel_path)
+        return self._listdir_cached(parent).get(name, (False, False))[1]
+
+    def _prefetch_listings(self):
+        """
+        List every directory the checks consult in one top-down pass, so the
+        checks only ever read the cache. A directory is skipped when its
+        parent's listing shows it is not a directory.
+        """
+        for rel_dir in LISTED_DIRS:
+            if not rel_dir or self.is_dir(rel_dir):
+                self._listdir_cached(rel_dir)
+            else:
+                self._listings[rel_dir] = {}
 
     def validate(self):
         """Run all validation checks"""
         print(f"🔍 Validating Next.js 16 project at: {self.project_path}")
         print("")
 
-        self.check_directory_structure()
-        self.check_next_config()
-        self.check_supabase_setup()
-        self.check_utilities()
-        self.check_env_files()
-        self.check_package_json()
+        cache = ResultsCache(CACHE_FILE)
+        key = cache.key(self.project_path)
+        cached = cache.get(self.project_path, key)
+        if cached is not None:
+            self.passed, self.warnings, self.errors = cached
+        else:
+            # With the listing cache filled up front the checks share nothing
+            # mutable, so run their remaining I/O concurrently and merge their
+            # results in the usual order
+            self._prefetch_listings()
+            with ThreadPoolExecutor(max_workers=len(self.CHECKS)) as executor:
+                futures = [executor.submit(getattr(self, name)) for name in self.CHECKS]
+                for future in futures:
+                    errors, warnings, passed = future.result()
+                    self.errors.extend(errors)
+                    self.warnings.extend(warnings)
+                    self.passed.extend(passed)
+            cache.put(self.project_path, key, self.passed, self.warnings, self.errors)
 
         self.print_results()
 
     def check_directory_structure(self):
         """Verify required directories exist"""
-        required_dirs = [
-            'app',
-            'app/actions',
-            'lib/supabase',
-            'lib/data',
-            'lib/utils',
-            'components',
-            'types',
-        ]
-
-        recommended_dirs = [
-            'app/(auth)',
-            'app/(dashboard)',
-            'app/api',
-            'lib/validations',
-            'lib/hooks',
-            'components/ui',
-            'components/shared',
-            'components/forms',
-            'config',
-        ]
-
-        for dir_path in required_dirs:
-            full_path = self.project_path / dir_path
-            if full_path.exists():
-                self.passed.append(f"Directory exists: {dir_path}")
+        errors, warnings, passed = [], [], []
+        for parent, name, found, missing in REQUIRED_DIRS:
+            if self._listdir_cached(parent).get(name, (False, False))[0]:
+                passed.append(found)
             else:
-                self.errors.append(f"Missing required directory: {dir_path}")
-
-        for dir_path in recommended_dirs:
-            full_path = self.project_path / dir_path
-            if not full_path.exists():
-                self.warnings.append(f"Recommended directory missing: {dir_path}")
+                errors.append(missing)
+
+        for parent, name, missing in RECOMMENDED_DIRS:
+            if not self._listdir_cached(parent).get(name, (False, False))[0]:
+                warnings.append(missing)
+
+        return errors, warnings, passed
+
+    def _try_read(self, *candidates):
+        """
+        Read the raw bytes of the first project-relative candidate that exists,
+        or return None.
+        Opening directly instead of checking exists() first saves a stat per
+        file, and the checks below are plain ASCII substring tests, so no
+        decoding is needed. Read errors other than a missing file propagate.
+        """
+        for rel_path in candidates:
+            try:
+                with open(os.path.join(self.project_path, rel_path), 'rb') as f:
+                    return f.read()
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+        return None
 
     def check_next_config(self):
         """Verify next.config.ts exists and has cacheComponents"""
-        config_file = self.project_path / 'next.config.ts'
-
-        if not config_file.exists():
-            config_file = self.project_path / 'next.config.js'
-
-        if not config_file.exists():
-            self.errors.append("Missing next.config.ts (or .js)")
-            return
-
+        errors, warnings, passed = [], [], []
         try:
-            content = config_file.read_text()
+            content = self._try_read('next.config.ts', 'next.config.js')
+            if content is None:
+                errors.append("Missing next.config.ts (or .js)")
+                return errors, warnings, passed
 
-            if 'cacheComponents' in content and 'cacheComponents: true' in content:
-                self.passed.append("Cache Components enabled in next.config")
+            if CACHE_COMPONENTS_ENABLED in content:
+                passed.append("Cache Components enabled in next.config")
             else:
-                self.warnings.append("Cache Components not enabled in next.config")
+                warnings.append("Cache Components not enabled in next.config")
 
-            if 'cacheLife' in content:
-                self.passed.append("Cache lifecycle profiles configured")
+            if CACHE_LIFE in content:
+                passed.append("Cache lifecycle profiles configured")
             else:
-                self.warnings.append("Cache lifecycle profiles not configured")
+                warnings.append("Cache lifecycle profiles not configured")
 
-        except Exception as e:
-            self.errors.append(f"Could not read next.config: {e}")
+        except OSError as e:
+            errors.append(f"Could not read next.config: {e}")
+
+        return errors, warnings, passed
 
     def check_supabase_setup(self):
         """Verify Supabase clients are properly set up"""
-        server_client = self.project_path / 'lib' / 'supabase' / 'server.ts'
-        client_client = self.project_path / 'lib' / 'supabase' / 'client.ts'
+        errors, warnings, passed = [], [], []
+        # Neither client can exist without the directory, so skip both opens
+        if not self.is_dir('lib/supabase'):
+            errors.append("Missing lib/supabase/server.ts")
+            errors.append("Missing lib/supabase/client.ts")
+            return errors, warnings, passed
 
-        if server_client.exists():
-            try:
-                content = server_client.read_text()
-                if 'createServerClient' in content and '@supabase/ssr' in content:
-                    self.passed.append("Supabase server client configured")
-                else:
-                    self.errors.append("Supabase server client missing proper imports")
-            except:
-                self.errors.append("Could not read Supabase server client")
-        else:
-            self.errors.append("Missing lib/supabase/server.ts")
+        try:
+            content = self._try_read('lib/supabase/server.ts')
+            if content is None:
+                errors.append("Missing lib/supabase/server.ts")
+            elif SERVER_CLIENT_FACTORY in content and SUPABASE_SSR_IMPORT in content:
+                passed.append("Supabase server client configured")
+            else:
+                errors.append("Supabase server client missing proper imports")
+        except OSError:
+            errors.append("Could not read Supabase server client")
 
-        if client_client.exists():
-            try:
-                content = client_client.read_text()
-                if 'createBrowserClient' in content:
-                    self.passed.append("Supabase browser client configured")
-                else:
-                    self.errors.append("Supabase browser client missing proper imports")
-            except:
-                self.errors.append("Could not read Supabase browser client")
-        else:
-            self.errors.append("Missing lib/supabase/client.ts")
+        try:
+            content = self._try_read('lib/supabase/client.ts')
+            if content is None:
+                errors.append("Missing lib/supabase/client.ts")
+            elif BROWSER_CLIENT_FACTORY in content:
+                passed.append("Supabase browser client configured")
+            else:
+                errors.append("Supabase browser client missing proper imports")
+        except OSError:
+            errors.append("Could not read Supabase browser client")
+
+        return errors, warnings, passed
 
     def check_utilities(self):
         """Check for standard utility files"""
+        errors, warnings, passed = [], [], []
         # Check for auth utilities
-        auth_file = self.project_path / 'lib' / 'auth.ts'
-        if auth_file.exists():
-            try:
-                content = auth_file.read_text()
-                if 'getCurrentUser' in content and 'requireAuth' in content:
-                    self.passed.append("Auth utilities configured")
-                else:
-                    self.warnings.append("Auth utilities incomplete")
-            except:
-                self.warnings.append("Could not read auth utilities")
-        else:
-            self.warnings.append("Missing lib/auth.ts")
+        try:
+            content = self._try_read('lib/auth.ts')
+            if content is None:
+                warnings.append("Missing lib/auth.ts")
+            elif GET_CURRENT_USER in content and REQUIRE_AUTH in content:
+                passed.append("Auth utilities configured")
+            else:
+                warnings.append("Auth utilities incomplete")
+        except OSError:
+            warnings.append("Could not read auth utilities")
 
         # Check for cn utility
-        cn_file = self.project_path / 'lib' / 'utils' / 'cn.ts'
-        if cn_file.exists():
-            self.passed.append("cn utility exists")
+        if self.is_file('lib/utils/cn.ts'):
+            passed.append("cn utility exists")
         else:
-            self.warnings.append("Missing lib/utils/cn.ts (recommended for Tailwind)")
+            warnings.append("Missing lib/utils/cn.ts (recommended for Tailwind)")
+
+        return errors, warnings, passed
 
     def check_env_files(self):
         """Check for environment variable files"""
-        env_local = self.project_path / '.env.local'
-        env_example = self.project_path / '.env.example'
-
-        if env_local.exists():
-            try:
-                content = env_local.read_text()
-                if 'NEXT_PUBLIC_SUPABASE_URL' in content:
-                    self.passed.append("Supabase URL configured in .env.local")
+        errors, warnings, passed = [], [], []
+        # The project root listing is already cached by the directory checks
+        try:
+            content = self._try_read('.env.local') if self.exists('.env.local') else None
+            if content is None:
+                warnings.append("Missing .env.local file")
+            else:
+                if SUPABASE_URL_VAR in content:
+                    passed.append("Supabase URL configured in .env.local")
                 else:
-                    self.warnings.append("Missing Supabase URL in .env.local")
+                    warnings.append("Missing Supabase URL in .env.local")
 
-                if 'NEXT_PUBLIC_SUPABASE_ANON_KEY' in content:
-                    self.passed.append("Supabase anon key configured in .env.local")
+                if SUPABASE_ANON_KEY_VAR in content:
+                    passed.append("Supabase anon key configured in .env.local")
                 else:
-                    self.warnings.append("Missing Supabase anon key in .env.local")
-            except:
-                self.errors.append("Could not read .env.local")
-        else:
-            self.warnings.append("Missing .env.local file")
+                    warnings.append("Missing Supabase anon key in .env.local")
+        except OSError:
+            errors.append("Could not read .env.local")
+
+        if not self.is_file('.env.example'):
+            warnings.append("Missing .env.example (recommended for team)")
 
-        if not env_example.exists():
-            self.warnings.append("Missing .env.example (recommended for team)")
+        return errors, warnings, passed
 
     def check_package_json(self):
         """Verify package.json has required dependencies"""
-        package_json = self.project_path / 'package.json'
-
-        if not package_json.exists():
-            self.errors.append("Missing package.json")
-            return
-
+        errors, warnings, passed = [], [], []
         try:
-            import json
-            data = json.loads(package_json.read_text())
-            deps = data.get('dependencies', {})
-
-            required_deps = {
-                'next': '16',
-                '@supabase/supabase-js': None,
-                '@supabase/ssr': None,
-                'zod': None,
-            }
-
-            for dep, min_version in required_deps.items():
-                if dep in deps:
-                    self.passed.append(f"Dependency installed: {dep}")
-                else:
-                    self.errors.append(f"Missing required dependency: {dep}")
+            content = self._try_read('package.json')
+            if content is None:
+                errors.append("Missing package.json")
+                return errors, warnings, passed
+
+            # Parsed whole: a package.json that is malformed anywhere is an
+            # error worth reporting, not just one with bad dependencies
+            deps = json_loads(content).get('dependencies', {})
 
-            recommended_deps = [
-                'react-hook-form',
-                '@hookform/resolvers',
-                'clsx',
-                'tailwind-merge',
-            ]
+            missing = REQUIRED_DEP_NAMES.difference(deps)
+            passed.extend([f"Dependency installed: {dep}"
+                                for dep in REQUIRED_DEPS if dep not in missing])
+            errors.extend([f"Missing required dependency: {dep}"
+                                for dep in REQUIRED_DEPS if dep in missing])
 
-            for dep in recommended_deps:
-                if dep not in deps:
-                    self.warnings.append(f"Recommended dependency missing: {dep}")
+            missing = RECOMMENDED_DEP_NAMES.difference(deps)
+            warnings.extend([f"Recommended dependency missing: {dep}"
+                                  for dep in RECOMMENDED_DEPS if dep in missing])
 
         except Exception as e:
-            self.errors.append(f"Could not read package.json: {e}")
+            errors.append(f"Could not read package.json: {e}")
+
+        return errors, warnings, passed
 
     def print_results(self):
         """Print validation results"""
-        print("")
-        print("=" * 60)
-        print("VALIDATION RESULTS")
-        print("=" * 60)
-        print("")
-
-        if self.passed:
-            print(f"✅ Passed ({len(self.passed)}):")
-            for item in self.passed:
-                print(f"   • {item}")
-            print("")
-
-        if self.warnings:
-            print(f"⚠️  Warnings ({len(self.warnings)}):")
-            for item in self.warnings:
-                print(f"   • {item}")
-            print("")
-
-        if self.errors:
-            print(f"❌ Errors ({len(self.errors)}):")
-            for item in self.errors:
-                print(f"   • {item}")
-            print("")
-
-        print("=" * 60)
-        print("")
+        # Assemble the whole report and hand it to stdout in one write
+        rule = "=" * 60
+        lines = ["", rule, "VALIDATION RESULTS", rule, ""]
+
+        for title, items in (
+            ("✅ Passed", self.passed),
+            ("⚠️  Warnings", self.warnings),
+            ("❌ Errors", self.errors),
+        ):
+            if items:
+                lines.append(f"{title} ({len(items)}):")
+                lines.extend([f"   • {item}" for item in items])
+                lines.append("")
+
+        lines += [rule, ""]
 
         if self.errors:
-            print("❌ Validation FAILED")
-            print("   Fix the errors above to ensure project follows team standards.")
-            return False
+            lines += ["❌ Validation FAILED",
+                      "   Fix the errors above to ensure project follows team standards."]
+            ok = False
         elif self.warnings:
-            print("⚠️  Validation PASSED with warnings")
-            print("   Consider addressing warnings for best practices.")
-            return True
+            lines += ["⚠️  Validation PASSED with warnings",
+                      "   Consider addressing warnings for best practices."]
+            ok = True
         else:
-            print("✅ Validation PASSED")
-            print("   Project follows all team standards!")
-            return True
+            lines += ["✅ Validation PASSED",
+                      "   Project follows all team standards!"]
+            ok = True
+
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
+        return ok
 
 def main():
     project_path = sys.argv[1] if len(sys.argv) > 1 else '.'